@@ -1,35 +1,272 @@
 #!/usr/bin/env python3
 
+import asyncio
+import email.utils
+import hashlib
+import io
 import logging
+import mimetypes
+import mmap
+import os
+import pickle
 import requests
+import socket
 import json
-from typing import Dict, Any
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AsyncExitStack, ExitStack
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Tuple
 from pathlib import Path
 
 import tomllib
 import click
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    # httpx negotiates HTTP/2 only if h2 is importable; it is often installed without it
+    import h2
+except ImportError:
+    h2 = None
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
 
-def load_config(config_path: str = "alphasense.toml") -> Dict[str, str]:
+# Kernel send buffer for upload sockets; large enough to keep high bandwidth-delay links full
+SEND_BUFFER_BYTES = 2 * 1024 * 1024
+
+# Bytes read from disk and written to the socket per send; fits within SEND_BUFFER_BYTES
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+class _SocketTunedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose sockets disable Nagle's algorithm and use a larger send
+    buffer, and which streams request bodies in chunk_size reads.
+    """
+
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_BYTES)
+    ]
+
+    def __init__(self, *args, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs):
+        # Set before super().__init__, which builds the pool manager
+        self.chunk_size = chunk_size
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.socket_options)
+        kwargs.setdefault('blocksize', self.chunk_size)
+        super().init_poolmanager(*args, **kwargs)
+
+# Retry policy shared by the requests adapter and the async upload path
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _make_session(pool_maxsize: int = 32, chunk_size: int = DEFAULT_CHUNK_SIZE) -> requests.Session:
+    """
+    Create a requests Session with a pooled, retrying HTTPS adapter.
+
+    Reusing one Session keeps the TCP/TLS connection to each host alive
+    between the auth and upload calls, and between successive uploads.
+    Connection errors and 429/5xx responses, including on POST, are retried
+    with exponential backoff, honoring Retry-After. Read errors are not
+    retried: the server may already have accepted an upload whose response
+    was lost, and resending it would ingest the document twice.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections per host
+        chunk_size: Bytes read from a streamed request body per socket write
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = _SocketTunedAdapter(
+        pool_maxsize=pool_maxsize,
+        chunk_size=chunk_size,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            connect=3,
+            read=0,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            # A 5xx can occasionally follow an accepted upload; 429/503 are the common case
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({'POST', 'GET'}),
+            respect_retry_after_header=True
+        )
+    )
+    session.mount('https://', adapter)
+    return session
+
+SESSION = _make_session()
+
+class _RewindableMultipartEncoder:
+    """
+    Streaming multipart body that urllib3 can rewind when it retries a request.
+
+    urllib3 replays a retried body by seeking back to the position tell()
+    reported before the first attempt. MultipartEncoder cannot seek, so
+    rewinding seeks each file back to the start and rebuilds the encoder
+    with the same boundary.
+    """
+
+    def __init__(self, fields: List[Tuple[str, Any]]):
+        self.fields = fields
+        self._encoder = MultipartEncoder(fields=fields)
+        self._position = 0
+        self.content_type = self._encoder.content_type
+        self.len = self._encoder.len
+
+    def __len__(self) -> int:
+        return self.len
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._encoder.read(size)
+        self._position += len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if (offset, whence) != (0, io.SEEK_SET):
+            raise io.UnsupportedOperation("multipart body can only be rewound to the start")
+        for _, value in self.fields:
+            if isinstance(value, tuple):
+                value[1].seek(0)
+        self._encoder = MultipartEncoder(fields=self.fields, boundary=self._encoder.boundary_value)
+        self._position = 0
+        return 0
+
+# Bulk uploads pack documents smaller than BULK_ITEM_BYTES into requests of at most BULK_BYTES
+BULK_BYTES = 20 * 1024 * 1024
+BULK_ITEM_BYTES = 5 * 1024 * 1024
+
+def _json_loads(data: bytes | str) -> Any:
+    """Deserialize JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _cache_dir() -> Path:
+    """
+    Return the per-user cache directory for this tool.
+
+    Honors XDG_CACHE_HOME and falls back to ~/.cache.
+    """
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'alphasense'
+
+def _write_private(path: Path, data: bytes) -> None:
+    """
+    Atomically write a file readable only by the current user.
+
+    Cache files hold credentials, so they are created 0600 (the mkstemp
+    default) inside a 0700 directory and moved into place with os.replace.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _load_toml_cached(config_file: Path, signature: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Parse a TOML file, reusing a pickled copy from a previous run when the
+    file's mtime and size are unchanged.
+
+    Set ALPHASENSE_NO_CACHE to bypass the cache entirely.
+    
+    Args:
+        config_file: Path to the TOML file
+        signature: (st_mtime_ns, st_size) of the file, as already stat'ed by the caller
+        
+    Returns:
+        Dict containing the parsed TOML document
+    """
+    if os.environ.get('ALPHASENSE_NO_CACHE'):
+        with open(config_file, "rb") as f:
+            return tomllib.load(f)
+
+    key = hashlib.sha256(str(config_file.resolve()).encode()).hexdigest()
+    cache_file = _cache_dir() / f'{key}.pkl'
+
+    try:
+        with open(cache_file, "rb") as f:
+            mtime_ns, size, parsed = pickle.load(f)
+        if (mtime_ns, size) == signature:
+            return parsed
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    with open(config_file, "rb") as f:
+        parsed = tomllib.load(f)
+
+    pickled = pickle.dumps((*signature, parsed), protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        _write_private(cache_file, pickled)
+    except OSError:
+        pass
+
+    return parsed
+
+REQUIRED_CONFIG_FIELDS = frozenset({
+    "username",
+    "password",
+    "api_key",
+    "client_id",
+    "client_secret",
+    "auth_url",
+    "ingestion_base_url"
+})
+
+def load_config(config_path: str = "alphasense.toml") -> Mapping[str, str]:
     """
     Load configuration from a TOML file.
+
+    Results are memoized per process on (path, mtime), so repeated calls
+    return the same read-only mapping until the file changes.
     
     Args:
         config_path: Path to the TOML configuration file
         
     Returns:
-        Dict containing configuration
+        Read-only mapping containing configuration
         
     Raises:
         FileNotFoundError: If the config file doesn't exist
         KeyError: If required configuration is missing
     """
-    config_file = Path(config_path)
-    
-    if not config_file.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
-    with open(config_file, "rb") as f:
-        config = tomllib.load(f)
+    return _load_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Mapping[str, str]:
+    config = _load_toml_cached(Path(config_path), (mtime_ns, size))
     
     # Extract auth configuration
     if "alphasense" not in config:
@@ -38,45 +275,55 @@ def load_config(config_path: str = "alphasense.toml") -> Dict[str, str]:
     config = config["alphasense"]
     
     # Validate required fields
-    required_fields = [
-        "username",
-        "password",
-        "api_key",
-        "client_id",
-        "client_secret",
-        "auth_url",
-        "ingestion_base_url"
-    ]
-    missing_fields = [field for field in required_fields if field not in config]
+    missing_fields = REQUIRED_CONFIG_FIELDS - config.keys()
     
     if missing_fields:
-        raise KeyError(f"Missing required auth fields: {missing_fields}")
+        raise KeyError(f"Missing required auth fields: {sorted(missing_fields)}")
     
-    return config
+    return MappingProxyType(config)
 
-def load_metadata_from_json(metadata_path: str) -> Dict[str, Any]:
+def load_metadata_from_json(metadata_path: str) -> Mapping[str, Any]:
     """
     Load document metadata from a JSON file.
+
+    Results are memoized per process on (path, mtime), so repeated calls
+    return the same read-only mapping until the file changes.
     
     Args:
         metadata_path: Path to the JSON metadata file
         
     Returns:
-        Dict containing document metadata
+        Read-only mapping containing document metadata
         
     Raises:
         FileNotFoundError: If the metadata file doesn't exist
-        json.JSONDecodeError: If the JSON is invalid
+        ValueError: If the JSON is invalid or not an object
     """
-    metadata_file = Path(metadata_path)
+    try:
+        stat = os.stat(metadata_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Metadata file not found: {metadata_path}") from None
     
-    if not metadata_file.exists():
-        raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
+    return _load_metadata_cached(str(metadata_path), stat.st_mtime_ns)
+
+@lru_cache(maxsize=32)
+def _load_metadata_cached(metadata_path: str, mtime_ns: int) -> Mapping[str, Any]:
+    with open(metadata_path, 'rb') as f:
+        metadata = _json_loads(f.read())
     
-    with open(metadata_file, 'r') as f:
-        metadata = json.load(f)
+    return _as_metadata(metadata)
+
+def _as_metadata(metadata: Any) -> Mapping[str, Any]:
+    """
+    Wrap parsed JSON metadata in a read-only mapping.
     
-    return metadata
+    Raises:
+        ValueError: If the metadata is not a JSON object
+    """
+    if not isinstance(metadata, dict):
+        raise ValueError(f"Metadata must be a JSON object, not {type(metadata).__name__}")
+    
+    return MappingProxyType(metadata)
 
 def authenticate_alphasense(
     api_key: str,
@@ -84,7 +331,8 @@ def authenticate_alphasense(
     password: str,
     client_id: str,
     client_secret: str,
-    url: str = 'https://api.alpha-sense.com/auth'
+    url: str = 'https://api.alpha-sense.com/auth',
+    session: requests.Session = SESSION
 ) -> Dict[str, Any]:
     """
     Authenticate with AlphaSense API using username/password credentials.
@@ -96,6 +344,7 @@ def authenticate_alphasense(
         client_id: Your client ID
         client_secret: Your client secret
         url: The authentication endpoint URL
+        session: Session used to send the request
         
     Returns:
         Dict containing the authentication response
@@ -117,7 +366,7 @@ def authenticate_alphasense(
         'client_secret': client_secret
     }
     
-    response = requests.post(url, headers=headers, data=data)
+    response = session.post(url, headers=headers, data=data)
     response.raise_for_status()  # Raises an exception for bad status codes
     
     return response.json()
@@ -128,7 +377,8 @@ def refresh_alphasense_token(
     client_id: str,
     client_secret: str,
     refresh_token: str,
-    url: str = 'https://api.alpha-sense.com/auth'
+    url: str = 'https://api.alpha-sense.com/auth',
+    session: requests.Session = SESSION
 ) -> Dict[str, Any]:
     """
     Refresh the access token for AlphaSense API.
@@ -139,6 +389,7 @@ def refresh_alphasense_token(
         client_secret: Your client secret
         refresh_token: The refresh token obtained during initial authentication
         url: The authentication endpoint URL
+        session: Session used to send the request
         
     Returns:
         Dict containing the authentication response
@@ -146,7 +397,6 @@ def refresh_alphasense_token(
     Raises:
         requests.RequestException: If the request fails
     """
-    url = 'https://api.alpha-sense.com/auth'
     
     headers = {
         'x-api-key': api_key,
@@ -160,18 +410,223 @@ def refresh_alphasense_token(
         'refresh_token': refresh_token
     }
     
-    response = requests.post(url, headers=headers, data=data)
+    response = session.post(url, headers=headers, data=data)
     response.raise_for_status()  # Raises an exception for bad status codes
     
     return response.json()
 
+# Cached access tokens are refreshed once they are within this many seconds of expiring
+TOKEN_EXPIRY_MARGIN = 60
+
+# Assumed lifetime of a token whose auth response has no expires_in
+DEFAULT_TOKEN_LIFETIME = 300
+
+def _token_file() -> Path:
+    """Return the path of the cached token file."""
+    return _cache_dir() / 'token.json'
+
+def _clear_cached_token() -> None:
+    """Delete the cached token, e.g. after the server rejects it."""
+    try:
+        _token_file().unlink(missing_ok=True)
+    except OSError:
+        pass
+
+def _is_unauthorized(error: Any) -> bool:
+    """Return True if error is an HTTP error for a 401 response."""
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code == 401
+
+def _save_token(token_file: Path, as_config: Mapping[str, str], auth_response: Dict[str, Any]) -> Dict[str, Any]:
+    """Persist an auth response to the token cache and return the cached record."""
+    token = {
+        'username': as_config['username'],
+        'auth_url': as_config['auth_url'],
+        'access_token': auth_response['access_token'],
+        'refresh_token': auth_response.get('refresh_token'),
+        'expires_at': time.time() + auth_response.get('expires_in', DEFAULT_TOKEN_LIFETIME)
+    }
+    if not os.environ.get('ALPHASENSE_NO_CACHE'):
+        try:
+            _write_private(token_file, _json_dumps(token))
+        except OSError:
+            pass
+    return token
+
+def load_or_refresh_token(
+    as_config: Mapping[str, str],
+    session: requests.Session = SESSION
+) -> str:
+    """
+    Return a valid access token, authenticating as little as possible.
+
+    A token cached by a previous run is reused until it is close to expiry,
+    then exchanged using its refresh token. A full password grant is only
+    made when there is no usable cached token or the refresh fails. Set
+    ALPHASENSE_NO_CACHE to always authenticate.
+    
+    Args:
+        as_config: Configuration returned by load_config
+        session: Session used to send requests
+        
+    Returns:
+        Access token string
+        
+    Raises:
+        requests.RequestException: If authentication fails
+    """
+    return _obtain_token(as_config, session)['access_token']
+
+def _obtain_token(as_config: Mapping[str, str], session: requests.Session) -> Dict[str, Any]:
+    """Return the token record (access_token, refresh_token, expires_at) for load_or_refresh_token."""
+    token_file = _token_file()
+    token = {}
+    
+    if not os.environ.get('ALPHASENSE_NO_CACHE'):
+        try:
+            with open(token_file, 'rb') as f:
+                token = _json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+    
+    # Ignore malformed records the same way as unparseable JSON
+    if not isinstance(token, dict) or not isinstance(token.get('expires_at'), (int, float)):
+        token = {}
+    
+    # Ignore tokens cached for a different account or auth endpoint
+    if (token.get('username'), token.get('auth_url')) != (as_config['username'], as_config['auth_url']):
+        token = {}
+    
+    if token.get('access_token') and token.get('expires_at', 0) - time.time() > TOKEN_EXPIRY_MARGIN:
+        return token
+    
+    if token.get('refresh_token'):
+        try:
+            auth_response = refresh_alphasense_token(
+                api_key=as_config["api_key"],
+                client_id=as_config["client_id"],
+                client_secret=as_config["client_secret"],
+                refresh_token=token['refresh_token'],
+                url=as_config["auth_url"],
+                session=session
+            )
+            auth_response.setdefault('refresh_token', token['refresh_token'])
+            return _save_token(token_file, as_config, auth_response)
+        except requests.RequestException:
+            pass
+    
+    auth_response = authenticate_alphasense(
+        api_key=as_config["api_key"],
+        username=as_config["username"],
+        password=as_config["password"],
+        client_id=as_config["client_id"],
+        client_secret=as_config["client_secret"],
+        url=as_config["auth_url"],
+        session=session
+    )
+    return _save_token(token_file, as_config, auth_response)
+
+# Files larger than this are memory-mapped for upload instead of read through a file object
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+class _MappedFile:
+    """
+    Read-only memory map of an open file, read like a file object.
+
+    MADV_SEQUENTIAL lets the kernel read ahead aggressively while the body
+    is streamed. The remaining length is exposed as len so MultipartEncoder
+    can tell when the part has been fully written.
+    """
+
+    def __init__(self, f):
+        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+
+    @property
+    def len(self) -> int:
+        return len(self._map) - self._map.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._map.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._map.seek(offset, whence)
+        return self._map.tell()
+
+    def tell(self) -> int:
+        return self._map.tell()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _open_upload_file(stack: ExitStack, path: Path):
+    """
+    Open a file for upload, registering it with stack for cleanup.
+
+    Files over MMAP_THRESHOLD_BYTES are memory-mapped, except on Windows.
+    """
+    f = stack.enter_context(open(path, 'rb'))
+    if os.name != 'nt' and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD_BYTES:
+        return stack.enter_context(_MappedFile(f))
+    return f
+
+@lru_cache(maxsize=None)
+def _mime_type(suffix: str) -> str:
+    """Guess a MIME type from a lowercase file extension."""
+    return mimetypes.types_map.get(suffix, 'application/octet-stream')
+
+def _collect_upload_files(document_path: str, attachments: Iterable[str]) -> List[Tuple[str, Path, str]]:
+    """
+    Validate a document and its attachments before any of them are opened.
+
+    Repeated attachment paths are uploaded once. Each path is stat'ed once.
+    
+    Args:
+        document_path: Path to the main document file
+        attachments: Attachment file paths
+        
+    Returns:
+        List of (field name, path, MIME type) tuples, main document first
+        
+    Raises:
+        FileNotFoundError: If document or attachment files don't exist
+    """
+    attachments = list(dict.fromkeys(attachments))
+    
+    try:
+        os.stat(document_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Document file not found: {document_path}") from None
+    
+    for attachment_path in attachments:
+        try:
+            os.stat(attachment_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Attachment file not found: {attachment_path}") from None
+    
+    upload_files = [('file', Path(document_path), 'application/octet-stream')]
+    
+    for attachment_path in attachments:
+        attachment_file = Path(attachment_path)
+        upload_files.append(('attachments', attachment_file, _mime_type(attachment_file.suffix.lower())))
+    
+    return upload_files
+
 def upload_document_to_alphasense(
     access_token: str,
     document_path: str,
-    metadata: Dict[str, Any],
-    attachments: list = [],
+    metadata: Mapping[str, Any],
+    attachments: Tuple[str, ...] = (),
     base_url: str = 'https://research.alpha-sense.com/services/i/ingestion-api/v1',
-    client_id: str = "enterprise-sync"
+    client_id: str = "enterprise-sync",
+    session: requests.Session = SESSION
 ) -> Dict[str, Any]:
     """
     Upload a document to AlphaSense using the ingestion API.
@@ -179,10 +634,11 @@ def upload_document_to_alphasense(
     Args:
         access_token: Bearer token from authentication
         document_path: Path to the main document file
-        metadata: Dictionary containing document metadata
-        attachments: List of attachment file paths (optional)
+        metadata: Mapping containing document metadata
+        attachments: Attachment file paths (optional)
         base_url: The ingestion API endpoint base URL
         client_id: Client ID for the request
+        session: Session used to send the request
         
     Returns:
         Dict containing the upload response
@@ -200,74 +656,608 @@ def upload_document_to_alphasense(
         'clientId': client_id
     }
     
-    # Prepare the main document file
-    document_file = Path(document_path)
-    if not document_file.exists():
-        raise FileNotFoundError(f"Document file not found: {document_path}")
+    # Validate every file up front so nothing is opened for a batch that can't be sent
+    upload_files = _collect_upload_files(document_path, attachments)
     
-    # Prepare files for upload
-    files = []
+    with ExitStack() as stack:
+        # Prepare fields for upload; file contents are streamed by the encoder
+        fields = [
+            (field, (path.name, _open_upload_file(stack, path), mime_type))
+            for field, path, mime_type in upload_files
+        ]
+        
+        # Add form data
+        fields.append(('metadata', _json_dumps(dict(metadata))))
+        
+        encoder = _RewindableMultipartEncoder(fields)
+        headers['Content-Type'] = encoder.content_type
+        
+        response = session.post(base_url, headers=headers, data=encoder)
+        response.raise_for_status()
+        return response.json()
+
+def upload_documents_batch(
+    access_token: str,
+    items: Iterable[Tuple[str, Mapping[str, Any], Iterable[str]]],
+    *,
+    max_workers: int = 8,
+    base_url: str = 'https://research.alpha-sense.com/services/i/ingestion-api/v1',
+    client_id: str = "enterprise-sync",
+    session: requests.Session = SESSION
+) -> Dict[str, Any]:
+    """
+    Upload several documents to AlphaSense concurrently.
+
+    Each upload runs on a worker thread sharing the given session, so the
+    session's pool size should be at least max_workers. A failing upload
+    does not cancel the rest of the batch.
     
-    # Add main document
-    files.append(('file', (document_file.name, open(document_file, 'rb'))))
+    Args:
+        access_token: Bearer token from authentication
+        items: Iterable of (document_path, metadata, attachments) tuples
+        max_workers: Maximum number of concurrent uploads
+        base_url: The ingestion API endpoint base URL
+        client_id: Client ID for the request
+        session: Session used to send the requests
+        
+    Returns:
+        Dict mapping each document path to its upload response, or to the
+        exception raised while uploading it
+    """
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                upload_document_to_alphasense,
+                access_token=access_token,
+                document_path=document_path,
+                metadata=metadata,
+                attachments=tuple(attachments),
+                base_url=base_url,
+                client_id=client_id,
+                session=session
+            ): document_path
+            for document_path, metadata, attachments in items
+        }
+
+        for future in as_completed(futures):
+            document_path = futures[future]
+            try:
+                results[document_path] = future.result()
+            except (OSError, requests.RequestException) as e:
+                results[document_path] = e
+
+    return results
+
+def _upload_size(item: Tuple[str, Mapping[str, Any], Iterable[str]]) -> int | None:
+    """Return the combined size of a document and its attachments, or None if any is missing."""
+    document_path, _, attachments = item
+    try:
+        return sum(os.stat(path).st_size for path in (document_path, *attachments))
+    except OSError:
+        return None
+
+def _pack_bulk(
+    items: List[Tuple[str, Mapping[str, Any], Iterable[str]]]
+) -> List[List[Tuple[str, Mapping[str, Any], Iterable[str]]]]:
+    """
+    Group upload items into buckets for bulk upload.
+
+    Items under BULK_ITEM_BYTES are packed first-fit, largest first, into
+    buckets of at most BULK_BYTES. Larger or unreadable items get a bucket
+    of their own.
+    """
+    sized = sorted(((_upload_size(item), item) for item in items), key=lambda pair: pair[0] or 0, reverse=True)
+    buckets = []
+    bucket_sizes = []
     
-    # Add attachments if provided
-    if attachments:
-        for attachment_path in attachments:
-            attachment_file = Path(attachment_path)
-            if not attachment_file.exists():
-                raise FileNotFoundError(f"Attachment file not found: {attachment_path}")
-            
-            # Determine MIME type based on file extension
-            mime_type = 'application/pdf' if attachment_file.suffix.lower() == '.pdf' else 'application/octet-stream'
-            files.append(('attachments', (attachment_file.name, open(attachment_file, 'rb'), mime_type)))
+    for size, item in sized:
+        if size is None or size >= BULK_ITEM_BYTES:
+            buckets.append([item])
+            bucket_sizes.append(BULK_BYTES)
+            continue
+        for i, bucket_size in enumerate(bucket_sizes):
+            if bucket_size + size <= BULK_BYTES:
+                buckets[i].append(item)
+                bucket_sizes[i] += size
+                break
+        else:
+            buckets.append([item])
+            bucket_sizes.append(size)
     
-    # Prepare form data
-    data = {
-        'metadata': json.dumps(metadata)
+    return buckets
+
+def _upload_bulk_request(
+    access_token: str,
+    bucket: List[Tuple[str, Mapping[str, Any], Iterable[str]]],
+    base_url: str,
+    client_id: str,
+    session: requests.Session
+) -> Dict[str, Any]:
+    """Upload a bucket of documents in a single multipart request with indexed field names."""
+    headers = {
+        'Authorization': f'bearer {access_token}',
+        'clientId': client_id
     }
     
+    bucket_files = [_collect_upload_files(document_path, attachments) for document_path, _, attachments in bucket]
+    
+    with ExitStack() as stack:
+        fields = []
+        for i, ((_, metadata, _), upload_files) in enumerate(zip(bucket, bucket_files)):
+            for field, path, mime_type in upload_files:
+                fields.append((f'{field}_{i}', (path.name, _open_upload_file(stack, path), mime_type)))
+            fields.append((f'metadata_{i}', _json_dumps(dict(metadata))))
+        
+        encoder = _RewindableMultipartEncoder(fields)
+        headers['Content-Type'] = encoder.content_type
+        
+        response = session.post(base_url + '/upload-documents', headers=headers, data=encoder)
+        response.raise_for_status()
+        return response.json()
+
+def bulk_upload_documents(
+    access_token: str,
+    items: Iterable[Tuple[str, Mapping[str, Any], Iterable[str]]],
+    *,
+    max_workers: int = 8,
+    base_url: str = 'https://research.alpha-sense.com/services/i/ingestion-api/v1',
+    client_id: str = "enterprise-sync",
+    session: requests.Session = SESSION
+) -> Dict[str, Any]:
+    """
+    Upload many small documents by packing them into a few large requests.
+
+    Documents are grouped by _pack_bulk and each group is sent as one
+    request. One group is sent first as a probe and the rest follow in
+    parallel. Once the server rejects a bulk request with a 4xx status, no
+    further bulk requests are made and the affected documents fall back to
+    one request each. A group containing a file that can't be read is also
+    sent one document at a time, so the readable documents still upload.
+    Single-document groups always use the regular upload.
+    
+    Args:
+        access_token: Bearer token from authentication
+        items: Iterable of (document_path, metadata, attachments) tuples
+        max_workers: Maximum number of concurrent requests
+        base_url: The ingestion API endpoint base URL
+        client_id: Client ID for the request
+        session: Session used to send the requests
+        
+    Returns:
+        Dict mapping each document path to its upload response, or to the
+        exception raised while uploading it
+    """
+    def upload_one(document_path, metadata, attachments):
+        try:
+            return upload_document_to_alphasense(
+                access_token=access_token,
+                document_path=document_path,
+                metadata=metadata,
+                attachments=tuple(attachments),
+                base_url=base_url,
+                client_id=client_id,
+                session=session
+            )
+        except (OSError, requests.RequestException) as e:
+            return e
+
+    bulk_rejected = threading.Event()
+
+    def upload_bulk(bucket):
+        # Returns None if the bucket must be sent one document at a time: when the
+        # server rejects bulk uploads (which also stops further bulk requests), or
+        # when a file in it can't be read, so one bad file doesn't fail its neighbours
+        try:
+            response = _upload_bulk_request(access_token, bucket, base_url, client_id, session)
+            return {item[0]: response for item in bucket}
+        except requests.HTTPError as e:
+            if 400 <= e.response.status_code < 500:
+                bulk_rejected.set()
+                return None
+            return {item[0]: e for item in bucket}
+        except requests.RequestException as e:
+            # Checked before OSError, which RequestException subclasses
+            return {item[0]: e for item in bucket}
+        except OSError:
+            return None
+
+    def upload_bucket(bucket):
+        if len(bucket) > 1 and not bulk_rejected.is_set():
+            bucket_results = upload_bulk(bucket)
+            if bucket_results is not None:
+                return bucket_results
+        return {item[0]: upload_one(*item) for item in bucket}
+
+    results = {}
+    buckets = _pack_bulk(list(items))
+
+    # Probe the bulk endpoint with one bucket first so that, if it is rejected,
+    # the rest of the documents are sent once each rather than twice
+    probe = next((bucket for bucket in buckets if len(bucket) > 1), None)
+    if probe is not None:
+        probe_results = upload_bulk(probe)
+        buckets.remove(probe)
+        if probe_results is None:
+            buckets.extend([item] for item in probe)
+            if bulk_rejected.is_set():
+                buckets = [[item] for bucket in buckets for item in bucket]
+        else:
+            results.update(probe_results)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(upload_bucket, bucket) for bucket in buckets]
+        for future in as_completed(futures):
+            results.update(future.result())
+
+    return results
+
+def _make_async_client() -> "httpx.AsyncClient":
+    """
+    Create an httpx AsyncClient with the same socket tuning as the requests
+    session. HTTP/2 is offered only when h2 is installed; without it httpx
+    would still advertise h2 and fail mid-request if the server chose it.
+
+    httpx streams multipart files in fixed 64 KiB chunks, so chunk_size
+    does not apply here.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=h2 is not None,
+            limits=httpx.Limits(max_connections=64),
+            retries=3,
+            socket_options=_SocketTunedAdapter.socket_options
+        ),
+        # No timeout, matching the requests-based upload path
+        timeout=None
+    )
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
     try:
-        response = requests.post(base_url, headers=headers, files=files, data=data)
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+async def upload_document_to_alphasense_async(
+    client: "httpx.AsyncClient",
+    access_token: str,
+    document_path: str,
+    metadata: Mapping[str, Any],
+    attachments: Tuple[str, ...] = (),
+    base_url: str = 'https://research.alpha-sense.com/services/i/ingestion-api/v1',
+    client_id: str = "enterprise-sync"
+) -> Dict[str, Any]:
+    """
+    Upload a document to AlphaSense using the ingestion API, asynchronously.
+
+    429/5xx responses are retried with exponential backoff, honoring
+    Retry-After, matching the retry policy of the requests session.
+    
+    Args:
+        client: httpx AsyncClient used to send the request
+        access_token: Bearer token from authentication
+        document_path: Path to the main document file
+        metadata: Mapping containing document metadata
+        attachments: Attachment file paths (optional)
+        base_url: The ingestion API endpoint base URL
+        client_id: Client ID for the request
+        
+    Returns:
+        Dict containing the upload response
+        
+    Raises:
+        FileNotFoundError: If document or attachment files don't exist
+        httpx.HTTPError: If the request fails
+    """
+    headers = {
+        'Authorization': f'bearer {access_token}',
+        'clientId': client_id
+    }
+    
+    upload_files = _collect_upload_files(document_path, attachments)
+    
+    with ExitStack() as stack:
+        files = [
+            (field, (path.name, _open_upload_file(stack, path), mime_type))
+            for field, path, mime_type in upload_files
+        ]
+        
+        data = {
+            'metadata': _json_dumps(dict(metadata))
+        }
+        
+        for attempt in range(RETRY_TOTAL + 1):
+            # httpx rewinds each file to the start whenever the body is rendered
+            response = await client.post(base_url + '/upload-document', headers=headers, files=files, data=data)
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                break
+            delay = _retry_after_seconds(response.headers.get('Retry-After'))
+            await asyncio.sleep(delay if delay is not None else RETRY_BACKOFF_FACTOR * 2 ** attempt)
+        
         response.raise_for_status()
         return response.json()
-    finally:
-        # Close all opened files
-        for file_tuple in files:
-            if len(file_tuple) >= 2 and hasattr(file_tuple[1][1], 'close'):
-                file_tuple[1][1].close()
+
+async def upload_documents_async(
+    access_token: str,
+    items: Iterable[Tuple[str, Mapping[str, Any], Iterable[str]]],
+    *,
+    max_concurrency: int = 8,
+    base_url: str = 'https://research.alpha-sense.com/services/i/ingestion-api/v1',
+    client_id: str = "enterprise-sync",
+    client: "httpx.AsyncClient | None" = None
+) -> Dict[str, Any]:
+    """
+    Upload several documents to AlphaSense concurrently on one event loop.
+
+    Uploads are multiplexed over a single HTTP/2 connection when the server
+    supports it. A failing upload does not cancel the rest of the batch.
+    Requires the optional httpx dependency.
+    
+    Args:
+        access_token: Bearer token from authentication
+        items: Iterable of (document_path, metadata, attachments) tuples
+        max_concurrency: Maximum number of uploads in flight at once
+        base_url: The ingestion API endpoint base URL
+        client_id: Client ID for the request
+        client: httpx AsyncClient to use; one is created and closed if omitted
+        
+    Returns:
+        Dict mapping each document path to its upload response, or to the
+        exception raised while uploading it
+    """
+    if httpx is None:
+        raise ImportError("httpx is required for async uploads: pip install 'alphasenseingestor[async]'")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload(document_path, metadata, attachments):
+        async with semaphore:
+            try:
+                return await upload_document_to_alphasense_async(
+                    client,
+                    access_token=access_token,
+                    document_path=document_path,
+                    metadata=metadata,
+                    attachments=attachments,
+                    base_url=base_url,
+                    client_id=client_id
+                )
+            except (OSError, ValueError, httpx.HTTPError) as e:
+                return e
+
+    async with AsyncExitStack() as stack:
+        if client is None:
+            # No timeout, matching the requests-based upload path
+            client = await stack.enter_async_context(_make_async_client())
+        items = list(items)
+        responses = await asyncio.gather(*[upload(*item) for item in items])
+
+    return {item[0]: response for item, response in zip(items, responses)}
+
+class Ingestor:
+    """
+    Reusable AlphaSense upload client.
+
+    Holds the configuration, a pooled Session (and, for upload_many_async,
+    an httpx client) and the current access token so that repeated
+    uploads, e.g. from a file watcher, pay the setup and authentication
+    cost once. The token is renewed when it nears expiry, and discarded
+    and renewed once if an upload is rejected with a 401.
+
+    Use as a context manager, or call close() (and aclose() after async
+    uploads) to release pooled connections.
+    """
+
+    def __init__(
+        self,
+        config_path: str = "alphasense.toml",
+        *,
+        concurrency: int = 8,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Args:
+            config_path: Path to the TOML configuration file
+            concurrency: Maximum number of concurrent uploads in upload_many
+                and upload_many_async
+            chunk_size: Bytes read from disk per upload write; not used by
+                the httpx async path, which streams in fixed chunks
+            
+        Raises:
+            FileNotFoundError: If the config file doesn't exist
+            KeyError: If required configuration is missing
+        """
+        self.config = load_config(config_path)
+        self.concurrency = concurrency
+        self.session = _make_session(pool_maxsize=concurrency, chunk_size=chunk_size)
+        self._client = None
+        self._token = None
+        self._token_expiry = 0.0
+
+    def authenticate(self) -> None:
+        """Obtain a fresh access token, from the token cache, a refresh, or a password grant."""
+        token = _obtain_token(self.config, self.session)
+        self._token = token['access_token']
+        self._token_expiry = token['expires_at']
+
+    def invalidate_token(self) -> None:
+        """Forget the current access token, including the cached copy."""
+        self._token = None
+        self._token_expiry = 0.0
+        _clear_cached_token()
+
+    @property
+    def access_token(self) -> str:
+        """A valid access token, authenticating or refreshing if needed."""
+        if self._token is None or self._token_expiry - time.time() <= TOKEN_EXPIRY_MARGIN:
+            self.authenticate()
+        return self._token
+
+    def upload(
+        self,
+        document_path: str,
+        metadata: Mapping[str, Any],
+        attachments: Tuple[str, ...] = ()
+    ) -> Dict[str, Any]:
+        """
+        Upload a single document. See upload_document_to_alphasense.
+        
+        Raises:
+            FileNotFoundError: If document or attachment files don't exist
+            requests.RequestException: If authentication or the request fails
+        """
+        for attempt in range(2):
+            try:
+                return upload_document_to_alphasense(
+                    access_token=self.access_token,
+                    document_path=document_path,
+                    metadata=metadata,
+                    attachments=attachments,
+                    base_url=self.config["ingestion_base_url"],
+                    session=self.session
+                )
+            except requests.HTTPError as e:
+                if attempt or not _is_unauthorized(e):
+                    raise
+                self.invalidate_token()
+
+    def upload_many(
+        self,
+        items: Iterable[Tuple[str, Mapping[str, Any], Iterable[str]]],
+        *,
+        bulk: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Upload several documents concurrently on a thread pool over the
+        Ingestor's session.
+
+        Uses bulk_upload_documents when bulk is set and
+        upload_documents_batch otherwise. See upload_many_async for the
+        HTTP/2 path.
+        
+        Args:
+            items: Iterable of (document_path, metadata, attachments) tuples
+            bulk: Pack small documents into combined requests
+            
+        Returns:
+            Dict mapping each document path to its upload response, or to the
+            exception raised while uploading it
+            
+        Raises:
+            requests.RequestException: If authentication fails
+        """
+        upload = bulk_upload_documents if bulk else upload_documents_batch
+        items = list(items)
+        results = {}
+        
+        for attempt in range(2):
+            results.update(upload(
+                self.access_token,
+                items,
+                max_workers=self.concurrency,
+                base_url=self.config["ingestion_base_url"],
+                session=self.session
+            ))
+            items = [item for item in items if _is_unauthorized(results[item[0]])]
+            if attempt or not items:
+                break
+            self.invalidate_token()
+        
+        return results
+
+    async def upload_many_async(
+        self,
+        items: Iterable[Tuple[str, Mapping[str, Any], Iterable[str]]]
+    ) -> Dict[str, Any]:
+        """
+        Upload several documents concurrently over HTTP/2.
+
+        Uses an httpx AsyncClient owned by the Ingestor, so connections are
+        reused across calls. The client is bound to the event loop it is
+        first used in; call aclose() from that loop when done. Requires the
+        optional httpx dependency.
+        
+        Args:
+            items: Iterable of (document_path, metadata, attachments) tuples
+            
+        Returns:
+            Dict mapping each document path to its upload response, or to the
+            exception raised while uploading it
+            
+        Raises:
+            requests.RequestException: If authentication fails
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for async uploads: pip install 'alphasenseingestor[async]'")
+        if self._client is None:
+            self._client = _make_async_client()
+        
+        items = list(items)
+        results = {}
+        
+        for attempt in range(2):
+            # Authentication uses the blocking requests session
+            access_token = await asyncio.to_thread(lambda: self.access_token)
+            results.update(await upload_documents_async(
+                access_token,
+                items,
+                max_concurrency=self.concurrency,
+                base_url=self.config["ingestion_base_url"],
+                client=self._client
+            ))
+            items = [item for item in items if _is_unauthorized(results[item[0]])]
+            if attempt or not items:
+                break
+            self.invalidate_token()
+        
+        return results
+
+    def close(self) -> None:
+        """Close the Session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the async client used by upload_many_async, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 @click.command()
-@click.argument('document')
+@click.argument('documents', nargs=-1, required=True)
 @click.option('-a', '--attachments', multiple=True, help='Path(s) to attachment file(s) (e.g., PDF, DOCX)')
+@click.option('--chunk-size', default=DEFAULT_CHUNK_SIZE, show_default=True, type=click.IntRange(min=8192), help='Bytes read from disk per upload write (threaded and bulk uploads only; async uploads use fixed 64 KiB chunks)')
 @click.option('-c', '--config', default='alphasense.toml', help='Path to the TOML configuration file')
 @click.option('-m', '--metadata', help='Path to JSON file with document metadata')
+@click.option('-b', '--bulk', is_flag=True, help='Pack small documents into combined upload requests')
+@click.option('-n', '--concurrency', default=8, show_default=True, type=click.IntRange(min=1), help='Number of documents to upload concurrently')
 @click.option('-v', '--verbose', is_flag=True, help='Enable verbose logging')
 
-def cli(document, attachments, config, metadata, verbose):
+def cli(documents, attachments, chunk_size, config, metadata, bulk, concurrency, verbose):
     """AlphaSense Document Ingestor CLI"""
     logger = logging.getLogger(__name__)
-    logging.basicConfig(format='%(asctime)s:%(levelname)s:%(message)s', datefmt='%Y-%m-%dT%H:%M:%S%z', level=logging.DEBUG)
-
-    if verbose:
-        logger.setLevel(logging.DEBUG)
-        logger.debug('Verbose mode on')
+    logging.basicConfig(format='%(asctime)s:%(levelname)s:%(message)s', datefmt='%Y-%m-%dT%H:%M:%S%z', level=logging.DEBUG if verbose else logging.INFO)
+    logger.debug('Verbose mode on')
     
     logger.info('Starting AlphaSense Ingestor...')
 
+    ingestor = None
+
     try:
-        as_config = load_config(config)
-        logger.info('Authenticating...')
-        auth_response = authenticate_alphasense(
-            api_key=as_config["api_key"],
-            username=as_config["username"],
-            password=as_config["password"],
-            client_id=as_config["client_id"],
-            client_secret=as_config["client_secret"],
-            url=as_config["auth_url"]
-        )
-        logger.debug(auth_response)
-        access_token = auth_response['access_token']
+        ingestor = Ingestor(config, concurrency=concurrency, chunk_size=chunk_size)
 
         logger.info('Loading metadata...')
         # Handle metadata argument
@@ -277,7 +1267,7 @@ def cli(document, attachments, config, metadata, verbose):
                 metadata = load_metadata_from_json(metadata)
             else:
                 # Parse as JSON string
-                metadata = json.loads(metadata)
+                metadata = _as_metadata(_json_loads(metadata))
         else:
             # Use default metadata
             metadata = {
@@ -285,18 +1275,35 @@ def cli(document, attachments, config, metadata, verbose):
                 "docAuthors": [{"authorName": "Test Author", "operation": "ADD"}]
             }
         
+        logger.info('Authenticating...')
+        ingestor.authenticate()
+        
         logger.info('Uploading...')
-        upload_document_to_alphasense(
-            access_token=access_token,
-            document_path=document,
-            attachments=attachments,
-            metadata=metadata,
-            base_url=as_config["ingestion_base_url"]
-        )
+        items = [(document, metadata, attachments) for document in documents]
+        if not bulk and len(items) > 1 and httpx is not None and h2 is not None:
+            async def upload_async():
+                try:
+                    return await ingestor.upload_many_async(items)
+                finally:
+                    await ingestor.aclose()
+            
+            results = asyncio.run(upload_async())
+        else:
+            results = ingestor.upload_many(items, bulk=bulk)
+        for document, result in results.items():
+            if isinstance(result, Exception):
+                logger.error('Upload failed for %s: %s', document, result)
+            else:
+                logger.info('Uploaded %s', document)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('Upload response for %s: %s', document, _json_dumps(result).decode())
 
-    except (FileNotFoundError, KeyError) as e:
-        logger.error(f"Configuration error: {e}")
+    except (FileNotFoundError, KeyError, tomllib.TOMLDecodeError) as e:
+        logger.error('Configuration error: %s', e)
     except requests.RequestException as e:
-        logger.error(f"Authentication failed: {e}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON metadata: {e}")
+        logger.error('Authentication failed: %s', e)
+    except ValueError as e:
+        logger.error('Invalid JSON metadata: %s', e)
+    finally:
+        if ingestor is not None:
+            ingestor.close()